@@ -1,27 +1,137 @@
 
+import array
+import csv
 from datetime import datetime
+import json
 from dataclasses import dataclass
+from functools import lru_cache, partial
 import os
+import re
 import sys
+import time
 from typing import Optional
 
+try:
+    import numpy as np
+except ImportError:
+
+    np = None
+
+try:
+    import numba
+except ImportError:
+
+    numba = None
+
+try:
+    import fastnumbers
+
+    # fast_float returns the input unchanged on bad data by default;
+    # raise instead so malformed rows keep hitting the skip path.
+    fast_float = partial(fastnumbers.fast_float, raise_on_invalid=True)
+except ImportError:
+
+    fast_float = float
+
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _totals_kernel(hours, rates, tax_rates):
+        """JIT-compiled accumulation loop over the payroll columns.
+
+        Returns (total_hours, total_gross, total_taxes); net is derived by
+        the caller. cache=True keeps the compiled code on disk so later
+        runs skip compilation.
+        """
+        total_hours = 0.0
+        total_gross = 0.0
+        total_taxes = 0.0
+        for i in range(hours.shape[0]):
+            gross = hours[i] * rates[i]
+            total_hours += hours[i]
+            total_gross += gross
+            total_taxes += gross * tax_rates[i]
+        return total_hours, total_gross, total_taxes
+else:
+    _totals_kernel = None
+
 
 DATA_FILE = os.path.join(os.path.dirname(__file__), 'employees.txt')
 USERS_FILE = os.path.join(os.path.dirname(__file__), 'users.txt')
+IDS_CACHE_FILE = os.path.join(os.path.dirname(__file__), 'ids.cache')
+
+_file_cache = {}
+
+
+def _file_exists(path: str) -> bool:
+    """os.path.exists with a one-second result cache.
+
+    The loaders and report path all stat the same two files; caching the
+    answer briefly avoids redundant stat() syscalls when a driver calls
+    them in a loop. Writers refresh the entry after creating the file.
+    """
+    v = _file_cache.get(path)
+    now = time.time()
+    if v is None or now - v[1] > 1.0:
+        v = (os.path.exists(path), now)
+        _file_cache[path] = v
+    return v[0]
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(s: str) -> datetime:
+    """Parse an mm/dd/yyyy string, caching results.
+
+    Payroll files usually repeat a handful of pay-period dates across many
+    records, so memoizing avoids re-running strptime on every row.
+    """
+    return datetime.strptime(s, "%m/%d/%Y")
+
+
+def _valid_mdy(s: str) -> bool:
+    """Cheap shape check for a canonical mm/dd/yyyy string.
+
+    Verifies slashes in the right positions and digit runs of length
+    2/2/4 without the datetime allocation and format parsing strptime
+    pays for. Strings that pass are already canonical, so they can be
+    used as-is; anything else falls back to the full strptime path.
+    """
+    return (len(s) == 10 and s[2] == '/' and s[5] == '/'
+            and s[:2].isdigit() and s[3:5].isdigit() and s[6:].isdigit())
+
+
+_TAX_RE = re.compile(r'\s*([0-9]*\.?[0-9]+)\s*(%?)\s*')
 
 
 def parse_tax_rate(s: str) -> float:
-    s = s.strip()
-    if s.endswith('%'):
-        s = s[:-1]
-    v = float(s)
-    if v > 1:
+    """Parse a tax rate entered as a percent or decimal (e.g. 20, 0.2, 20%).
+
+    A single fullmatch against the precompiled pattern validates and
+    extracts the number in one scan, instead of strip/endswith/slice
+    allocating intermediate strings. Raises ValueError on bad input.
+    """
+    m = _TAX_RE.fullmatch(s)
+    if m is None:
+        raise ValueError(f"invalid tax rate: {s!r}")
+    v = float(m.group(1))
+    if m.group(2) or v > 1:
         v = v / 100.0
     return v
 
 
+@lru_cache(maxsize=4096)
 def money(v: float) -> str:
-    return f"${v:,.2f}"
+    """Format a dollar amount as $N,NNN.NN using integer cents.
+
+    Splitting into whole dollars and cents keeps the formatting on the
+    cheap integer path instead of float-to-decimal conversion, and the
+    cache reuses rendered strings for amounts that repeat across rows
+    (common rates/tax amounts).
+    """
+    c = round(v * 100)
+    sign = '-' if c < 0 else ''
+    dollars, cents = divmod(abs(c), 100)
+    return f"{sign}${dollars:,}.{cents:02d}"
 
 
 def get_employee_name() -> str:
@@ -76,8 +186,8 @@ def get_date_range():
         to = input("To date (mm/dd/yyyy): ").strip()
         try:
             
-            datetime.strptime(frm, "%m/%d/%Y")
-            datetime.strptime(to, "%m/%d/%Y")
+            _parse_date(frm)
+            _parse_date(to)
             return frm, to
         except Exception:
             print("Please enter dates in mm/dd/yyyy format. Try again.")
@@ -90,89 +200,212 @@ def calculate_pay(hours: float, rate: float, tax_rate: float):
     return gross, taxes, net
 
 
-def display_employee(name: str, hours: float, rate: float, gross: float, tax_rate: float, taxes: float, net: float):
-    print()
-    print(f"Employee: {name}")
-    print(f"Hours worked: {hours}")
-    print(f"Hourly rate: {money(rate)}")
-    print(f"Gross pay: {money(gross)}")
-    print(f"Income tax rate: {tax_rate:.2%}")
-    print(f"Income taxes: {money(taxes)}")
-    print(f"Net pay: {money(net)}")
-    print("-" * 40)
+_EMP_TMPL = ("\nEmployee: {name}\n"
+             "Hours worked: {hours}\n"
+             "Hourly rate: {rate}\n"
+             "Gross pay: {gross}\n"
+             "Income tax rate: {tax:.2%}\n"
+             "Income taxes: {taxes}\n"
+             "Net pay: {net}\n"
+             + "-" * 40 + "\n")
 
 
-def process_records(records: list) -> dict:
-    
-    totals = {
-        'employees': 0,
-        'hours': 0.0,
-        'gross': 0.0,
-        'taxes': 0.0,
-        'net': 0.0,
-    }
-    for rec in records:
-        gross, taxes, net = calculate_pay(rec['hours'], rec['rate'], rec['tax_rate'])
-        print()
-        print(f"From date: {rec['from']}")
-        print(f"To date:   {rec['to']}")
-        display_employee(rec['name'], rec['hours'], rec['rate'], gross, rec['tax_rate'], taxes, net)
+def display_employee(name: str, hours: float, rate: float, gross: float, tax_rate: float, taxes: float, net: float) -> str:
+    """Return the formatted detail block for one employee.
 
-        totals['employees'] += 1
-        totals['hours'] += rec['hours']
-        totals['gross'] += gross
-        totals['taxes'] += taxes
-        totals['net'] += net
+    Returning a string instead of printing lets callers collect all the
+    per-record blocks and write them to stdout in one call, rather than
+    paying for eight print() calls per record. The block layout lives in
+    _EMP_TMPL so the template is parsed once at import instead of per
+    call.
+    """
+    return _EMP_TMPL.format(name=name, hours=hours, rate=money(rate),
+                            gross=money(gross), tax=tax_rate,
+                            taxes=money(taxes), net=money(net))
 
-    return totals
 
-def append_record_to_file(frm: str, to: str, name: str, hours: float, rate: float, tax_rate: float, uid: Optional[str] = None):
-    """Append a single record to the data file in pipe-delimited format.
-    Format: from|to|name|hours|rate|tax_rate
-    """
-    
-    try:
-        frm_dt = datetime.strptime(frm, "%m/%d/%Y")
-        to_dt = datetime.strptime(to, "%m/%d/%Y")
-        frm_s = frm_dt.strftime("%m/%d/%Y")
-        to_s = to_dt.strftime("%m/%d/%Y")
-    except Exception:
-        
+def process_records(records: "RecordBatch") -> dict:
+
+    buf = []
+    for frm, to, name, hours, rate, tax_rate in zip(
+            records.froms, records.tos, records.names,
+            records.hours, records.rates, records.tax_rates):
+        gross, taxes, net = calculate_pay(hours, rate, tax_rate)
+        buf.append(f"\nFrom date: {frm}\nTo date:   {to}\n")
+        buf.append(display_employee(name, hours, rate, gross, tax_rate, taxes, net))
+    sys.stdout.write("".join(buf))
+
+
+    return sum_payroll_columns(records.hours, records.rates, records.tax_rates)
+
+def _format_record_line(frm: str, to: str, name: str, hours: float, rate: float, tax_rate: float, uid: Optional[str] = None) -> str:
+    """Build the pipe-delimited line for one record, normalizing dates."""
+    if _valid_mdy(frm) and _valid_mdy(to):
+
         frm_s = frm
         to_s = to
+    else:
+        try:
+            frm_dt = _parse_date(frm)
+            to_dt = _parse_date(to)
+            frm_s = frm_dt.strftime("%m/%d/%Y")
+            to_s = to_dt.strftime("%m/%d/%Y")
+        except Exception:
+
+            frm_s = frm
+            to_s = to
+
+
 
-    
-    
     if uid:
-        line = f"{uid}|{frm_s}|{to_s}|{name}|{hours}|{rate}|{tax_rate}\n"
-    else:
-        line = f"{frm_s}|{to_s}|{name}|{hours}|{rate}|{tax_rate}\n"
+        return f"{uid}|{frm_s}|{to_s}|{name}|{hours}|{rate}|{tax_rate}\n"
+    return f"{frm_s}|{to_s}|{name}|{hours}|{rate}|{tax_rate}\n"
+
+
+def append_record_to_file(frm: str, to: str, name: str, hours: float, rate: float, tax_rate: float, uid: Optional[str] = None):
+    """Append a single record to the data file in pipe-delimited format.
+    Format: from|to|name|hours|rate|tax_rate
+    """
+    line = _format_record_line(frm, to, name, hours, rate, tax_rate, uid=uid)
+    old_mtime = os.path.getmtime(DATA_FILE) if os.path.exists(DATA_FILE) else None
     with open(DATA_FILE, 'a', encoding='utf-8') as f:
         f.write(line)
+    _file_cache[DATA_FILE] = (True, time.time())
+    _update_ids_cache(old_mtime, [uid])
+
+
+def append_records_to_file(records: "RecordBatch"):
+    """Append a batch of payroll entries to the data file in one write.
+
+    Opening the file once per admin session and writing all the lines in
+    a single call avoids paying an open/close plus a small write() per
+    record entered.
+    """
+    if not len(records):
+        return
+    lines = [_format_record_line(frm, to, name, hours, rate, tax_rate, uid=uid)
+             for uid, frm, to, name, hours, rate, tax_rate in zip(
+                 records.ids, records.froms, records.tos, records.names,
+                 records.hours, records.rates, records.tax_rates)]
+    old_mtime = os.path.getmtime(DATA_FILE) if os.path.exists(DATA_FILE) else None
+    with open(DATA_FILE, 'a', encoding='utf-8') as f:
+        f.write("".join(lines))
+    _file_cache[DATA_FILE] = (True, time.time())
+    _update_ids_cache(old_mtime, records.ids)
+
+
+class _IdLookup:
+    """Adaptive membership store for id strings.
+
+    Keeps ids in a plain list and answers the first few `in` tests with a
+    linear scan; once lookups pass a small threshold it builds a set and
+    uses hash lookups from then on. Short admin sessions that only check a
+    couple of ids never pay the up-front cost of building a set from a
+    large data file, while bulk validation still gets O(1) membership.
+    """
+
+    _PROMOTE_AFTER = 8
+
+    def __init__(self, ids=None):
+        self._ids = list(ids) if ids is not None else []
+        self._set = None
+        self._lookups = 0
+
+    def add(self, uid: str):
+        if self._set is not None:
+            self._set.add(uid)
+        else:
+            self._ids.append(uid)
+
+    def __contains__(self, uid: str) -> bool:
+        if self._set is None:
+            self._lookups += 1
+            if self._lookups <= self._PROMOTE_AFTER:
+                return uid in self._ids
+
+            self._set = set(self._ids)
+            self._ids = None
+        return uid in self._set
+
+    def __len__(self) -> int:
+        if self._set is not None:
+            return len(self._set)
+        return len(set(self._ids))
+
+
+def _scan_ids() -> list:
+    """Parse DATA_FILE and return the ids of its 7-field rows."""
+    ids = []
+    with open(DATA_FILE, encoding='utf-8') as f:
+        data = f.read()
+    for line in data.splitlines():
+
+        uid, sep, rest = line.partition('|')
+        if sep and rest.count('|') >= 5:
+            ids.append(uid.strip())
+    return ids
+
+
+def _write_ids_cache(mtime: float, ids: list):
+    """Atomically write the sidecar id cache (tempfile + rename)."""
+    tmp = IDS_CACHE_FILE + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'mtime': mtime, 'ids': ids}, f)
+    os.replace(tmp, IDS_CACHE_FILE)
+
+
+def _update_ids_cache(old_mtime, new_uids):
+    """Extend the sidecar cache after appending records to DATA_FILE.
 
+    Only applies when the cache was valid for the file as it stood
+    before the append (matching old_mtime); a stale cache is left alone
+    and the next load_existing_ids rescans the data file.
+    """
+    try:
+        with open(IDS_CACHE_FILE, encoding='utf-8') as f:
+            cached = json.load(f)
+    except Exception:
+        return
+    if old_mtime is None or cached.get('mtime') != old_mtime:
+        return
+    ids = cached.get('ids', [])
+    ids.extend(u for u in new_uids if u)
+    try:
+        _write_ids_cache(os.path.getmtime(DATA_FILE), ids)
+    except OSError:
+        pass
 
-def load_existing_ids() -> set:
-    """Read DATA_FILE and return a set of existing user ids.
+
+def load_existing_ids() -> _IdLookup:
+    """Return the existing user ids from DATA_FILE as an _IdLookup.
 
     This expects the file to use the extended format where the first field
     is an id: id|from|to|name|hours|rate|tax_rate. Lines in the old 6-field
     format are ignored for id collection to remain backward compatible.
+
+    The parsed ids are kept in a sidecar cache keyed by the data file's
+    mtime, so repeated startups against an unchanged file skip the O(N)
+    scan.
     """
-    ids = set()
-    if not os.path.exists(DATA_FILE):
-        return ids
-    with open(DATA_FILE, encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split('|')
-            if len(parts) >= 7:
-                ids.add(parts[0])
-    return ids
+    if not _file_exists(DATA_FILE):
+        return _IdLookup()
+    mtime = os.path.getmtime(DATA_FILE)
+    try:
+        with open(IDS_CACHE_FILE, encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('mtime') == mtime:
+            return _IdLookup(cached.get('ids', []))
+    except Exception:
+        pass
+    ids = _scan_ids()
+    try:
+        _write_ids_cache(mtime, ids)
+    except OSError:
+        pass
+    return _IdLookup(ids)
 
 
-def get_employee_id(existing_ids: set) -> str:
+def get_employee_id(existing_ids: _IdLookup) -> str:
     """Prompt for a user id, validating it isn't already in existing_ids."""
     while True:
         uid = input("Employee ID: ").strip()
@@ -185,24 +418,21 @@ def get_employee_id(existing_ids: set) -> str:
         return uid
 
 
-def load_existing_user_ids() -> set:
-    """Read USERS_FILE and return a set of existing user ids.
+def load_existing_user_ids() -> _IdLookup:
+    """Read USERS_FILE and return the existing user ids as an _IdLookup.
 
     File format: id|password|auth_code (pipe-delimited). Lines that don't
     match are skipped.
     """
-    ids = set()
-    if not os.path.exists(USERS_FILE):
-        return ids
+    if not _file_exists(USERS_FILE):
+        return _IdLookup()
     with open(USERS_FILE, encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split('|')
-            if len(parts) >= 3:
-                ids.add(parts[0])
-    return ids
+        data = f.read()
+    lines = (line.strip() for line in data.splitlines())
+    ids = [row[0] for row in csv.reader(lines, delimiter='|',
+                                        quoting=csv.QUOTE_NONE)
+           if len(row) >= 3]
+    return _IdLookup(ids)
 
 
 @dataclass
@@ -213,21 +443,49 @@ class Login:
     authorization: str
 
 
+class RecordBatch:
+    """Payroll entries stored as parallel columns (structure-of-arrays).
+
+    String fields live in plain lists and the numeric fields in packed
+    array.array('d') columns, so the totals summary can hand contiguous
+    float columns straight to sum_payroll_columns instead of walking a
+    list of per-record objects, and NumPy (when installed) can consume
+    them without transposition.
+    """
+
+    def __init__(self):
+        self.ids = []
+        self.froms = []
+        self.tos = []
+        self.names = []
+        self.hours = array.array('d')
+        self.rates = array.array('d')
+        self.tax_rates = array.array('d')
+
+    def append(self, uid: str, frm: str, to: str, name: str, hours: float, rate: float, tax_rate: float):
+        self.ids.append(uid)
+        self.froms.append(frm)
+        self.tos.append(to)
+        self.names.append(name)
+        self.hours.append(hours)
+        self.rates.append(rate)
+        self.tax_rates.append(tax_rate)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
 def load_all_users() -> list:
     """Return a list of Login objects from USERS_FILE (empty if file missing)."""
     users = []
-    if not os.path.exists(USERS_FILE):
+    if not _file_exists(USERS_FILE):
         return users
     with open(USERS_FILE, encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split('|')
-            if len(parts) < 3:
-                continue
-            uid, pwd, auth = parts[0], parts[1], parts[2]
-            users.append(Login(uid, pwd, auth))
+        data = f.read()
+    lines = (line.strip() for line in data.splitlines())
+    users = [Login(*row[:3]) for row in csv.reader(lines, delimiter='|',
+                                                   quoting=csv.QUOTE_NONE)
+             if len(row) >= 3]
     return users
 
 
@@ -239,6 +497,7 @@ def append_user_to_file(uid: str, password: str, auth_code: str):
     line = f"{uid}|{password}|{auth_code}\n"
     with open(USERS_FILE, 'a', encoding='utf-8') as f:
         f.write(line)
+    _file_cache[USERS_FILE] = (True, time.time())
 
 
 def collect_user_accounts():
@@ -298,21 +557,47 @@ def display_all_users():
         print(f"ID: {u.uid}    Password: {u.password}    Auth: {u.authorization}")
 
 
+_USER_MAP_CACHE = {'mtime': None, 'map': None}
+
+
+def _get_user_map() -> dict:
+    """Return a {uid: Login} map for USERS_FILE, rebuilt only on change.
+
+    The map is cached against the file's mtime, so a process that serves
+    many logins builds the hash once and every later lookup is a dict
+    get. append_user_to_file bumps the mtime, which invalidates the
+    cache on the next call.
+    """
+    mtime = os.path.getmtime(USERS_FILE)
+    if _USER_MAP_CACHE['mtime'] != mtime:
+        _USER_MAP_CACHE['map'] = {u.uid: u for u in load_all_users()}
+        _USER_MAP_CACHE['mtime'] = mtime
+    return _USER_MAP_CACHE['map']
+
+
+def find_user(uid: str) -> Optional[Login]:
+    """Look up a single user id in USERS_FILE.
+
+    Served from the mtime-keyed user map, so repeat logins cost one dict
+    lookup regardless of user-file size. Returns None if the file or the
+    id is missing.
+    """
+    if not _file_exists(USERS_FILE):
+        return None
+    return _get_user_map().get(uid)
+
+
 def perform_login() -> Login:
     """Perform an interactive login using records from USERS_FILE.
 
-    Reads all users into a list, prompts for user id and password, validates
-    both, and returns a Login object on success. On failure the function will
+    Prompts for user id and password, looks up the single matching record,
+    and returns a Login object on success. On failure the function will
     print an error message and exit the program.
     """
-    users = load_all_users()
-    if not users:
+    if not _file_exists(USERS_FILE):
         print("No users found. Please create user accounts first.")
         sys.exit(1)
 
-    
-    user_map = {u.uid: u for u in users}
-
     uid = input("Login - Enter user ID: ").strip()
     if not uid:
         print("No user ID entered. Exiting.")
@@ -320,7 +605,7 @@ def perform_login() -> Login:
 
     pwd = input("Enter password: ").strip()
 
-    user = user_map.get(uid)
+    user = find_user(uid)
     if user is None:
         print("User ID not found. Exiting.")
         sys.exit(1)
@@ -336,6 +621,98 @@ def perform_login() -> Login:
 
 
 
+def read_report_rows(filter_from: Optional[str] = None) -> list:
+    """Read DATA_FILE and return a list of (frm, to, name, hours, rate, tax_rate)
+    tuples, with the numeric fields already converted to float.
+
+    If filter_from is given, only rows whose From date matches are returned.
+    Handles both the old 6-field format and the id-prefixed 7-field format.
+    Malformed lines are skipped.
+    """
+    rows = []
+    if not _file_exists(DATA_FILE):
+        return rows
+    with open(DATA_FILE, 'rb') as f:
+        data = f.read()
+
+    if filter_from is not None:
+
+
+        needle = filter_from.encode('utf-8') + b'|'
+        nlen = len(needle)
+        kept = []
+        for raw in data.split(b'\n'):
+            raw = raw.strip()
+            if raw.startswith(needle):
+                kept.append(raw)
+            else:
+                idx = raw.find(b'|')
+                if idx >= 0 and raw[idx + 1:idx + 1 + nlen] == needle:
+                    kept.append(raw)
+        lines = [raw.decode('utf-8') for raw in kept]
+    else:
+        lines = [line.strip() for line in data.decode('utf-8').splitlines()]
+    for parts in csv.reader(lines, delimiter='|', quoting=csv.QUOTE_NONE):
+
+        if len(parts) == 6:
+            frm, to, name, hours_s, rate_s, tax_rate_s = parts
+        elif len(parts) >= 7:
+
+            _, frm, to, name, hours_s, rate_s, tax_rate_s = parts[:7]
+        else:
+            continue
+        if (filter_from is not None) and (frm != filter_from):
+            continue
+        try:
+            rows.append((frm, to, name, fast_float(hours_s), fast_float(rate_s), fast_float(tax_rate_s)))
+        except Exception:
+
+            continue
+    return rows
+
+
+def sum_payroll_columns(hours, rates, tax_rates) -> dict:
+    """Compute the totals summary from parallel columns of payroll numbers.
+
+    Uses NumPy array reductions when NumPy is installed (one vectorized pass
+    instead of a Python-level loop); otherwise falls back to plain sums.
+    """
+    if np is not None and hours:
+        h = np.asarray(hours, dtype=np.float64)
+        r = np.asarray(rates, dtype=np.float64)
+        t = np.asarray(tax_rates, dtype=np.float64)
+        if _totals_kernel is not None:
+            total_hours, total_gross, total_taxes = _totals_kernel(h, r, t)
+        else:
+            gross = h * r
+            taxes = gross * t
+            total_hours = float(h.sum())
+            total_gross = float(gross.sum())
+            total_taxes = float(taxes.sum())
+        return {
+            'employees': len(hours),
+            'hours': float(total_hours),
+            'gross': float(total_gross),
+            'taxes': float(total_taxes),
+            'net': float(total_gross) - float(total_taxes),
+        }
+
+    totals = {
+        'employees': len(hours),
+        'hours': 0.0,
+        'gross': 0.0,
+        'taxes': 0.0,
+        'net': 0.0,
+    }
+    for h, r, t in zip(hours, rates, tax_rates):
+        gross, taxes, net = calculate_pay(h, r, t)
+        totals['hours'] += h
+        totals['gross'] += gross
+        totals['taxes'] += taxes
+        totals['net'] += net
+    return totals
+
+
 def run_report(login: Optional[Login] = None):
     """Prompt for a From date (or 'All') and read the data file, printing
     the records that match. Compute gross, taxes and net for each and a final
@@ -347,69 +724,47 @@ def run_report(login: Optional[Login] = None):
         if choice.lower() == 'all':
             filter_all = True
             break
+        if _valid_mdy(choice):
+
+            filter_all = False
+            break
         try:
-            parsed = datetime.strptime(choice, "%m/%d/%Y")
-            
+            parsed = _parse_date(choice)
+
             choice = parsed.strftime("%m/%d/%Y")
             filter_all = False
             break
         except Exception:
             print("Please enter dates in mm/dd/yyyy format or 'All'.")
 
-    
-    totals = {
-        'employees': 0,
-        'hours': 0.0,
-        'gross': 0.0,
-        'taxes': 0.0,
-        'net': 0.0,
-    }
 
-    
     if login is not None:
         print()
         print(f"Logged in as ID: {login.uid}    Password: {login.password}    Auth: {login.authorization}")
-    if not os.path.exists(DATA_FILE):
+    if not _file_exists(DATA_FILE):
         print("No employee records file found.")
-        return totals
+        return {
+            'employees': 0,
+            'hours': 0.0,
+            'gross': 0.0,
+            'taxes': 0.0,
+            'net': 0.0,
+        }
 
-    with open(DATA_FILE, encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split('|')
-            
-            if len(parts) == 6:
-                frm, to, name, hours_s, rate_s, tax_rate_s = parts
-            elif len(parts) >= 7:
-                
-                _, frm, to, name, hours_s, rate_s, tax_rate_s = parts[:7]
-            else:
-                continue
-            if (not filter_all) and (frm != choice):
-                continue
-            try:
-                hours = float(hours_s)
-                rate = float(rate_s)
-                tax_rate = float(tax_rate_s)
-            except Exception:
-                
-                continue
+    rows = read_report_rows(None if filter_all else choice)
+
+
+    buf = []
+    for frm, to, name, hours, rate, tax_rate in rows:
+        gross, taxes, net = calculate_pay(hours, rate, tax_rate)
+        buf.append(f"\nFrom date: {frm}\nTo date:   {to}\n")
+        buf.append(display_employee(name, hours, rate, gross, tax_rate, taxes, net))
+    sys.stdout.write("".join(buf))
 
-            gross, taxes, net = calculate_pay(hours, rate, tax_rate)
-            print()
-            print(f"From date: {frm}")
-            print(f"To date:   {to}")
-            display_employee(name, hours, rate, gross, tax_rate, taxes, net)
 
-            totals['employees'] += 1
-            totals['hours'] += hours
-            totals['gross'] += gross
-            totals['taxes'] += taxes
-            totals['net'] += net
+    totals = sum_payroll_columns(
+        [r[3] for r in rows], [r[4] for r in rows], [r[5] for r in rows])
 
-   
     display_summary(totals, login=login)
     return totals
 
@@ -442,7 +797,7 @@ def main():
     
     if login.authorization == 'Admin':
         print("Payroll entry - enter employee data. Type 'End' for the name to finish.")
-        records = []
+        records = RecordBatch()
         while True:
             name = get_employee_name()
             if name.lower() == 'end':
@@ -455,34 +810,28 @@ def main():
             uid = get_employee_id(existing_ids)
 
             frm, to = get_date_range()
-            
-            try:
-                frm_dt = datetime.strptime(frm, "%m/%d/%Y")
-                to_dt = datetime.strptime(to, "%m/%d/%Y")
-                frm = frm_dt.strftime("%m/%d/%Y")
-                to = to_dt.strftime("%m/%d/%Y")
-            except Exception:
-                pass
+
+            if not (_valid_mdy(frm) and _valid_mdy(to)):
+                try:
+                    frm_dt = _parse_date(frm)
+                    to_dt = _parse_date(to)
+                    frm = frm_dt.strftime("%m/%d/%Y")
+                    to = to_dt.strftime("%m/%d/%Y")
+                except Exception:
+                    pass
 
             hours = get_hours()
             rate = get_hourly_rate()
             tax_rate = get_income_tax_rate()
 
-            records.append({
-                'id': uid,
-                'from': frm,
-                'to': to,
-                'name': name,
-                'hours': hours,
-                'rate': rate,
-                'tax_rate': tax_rate,
-            })
-            
-            try:
-                append_record_to_file(frm, to, name, hours, rate, tax_rate, uid=uid)
-                existing_ids.add(uid)
-            except Exception as e:
-                print(f"Warning: could not write record to file: {e}")
+            records.append(uid, frm, to, name, hours, rate, tax_rate)
+            existing_ids.add(uid)
+
+
+        try:
+            append_records_to_file(records)
+        except Exception as e:
+            print(f"Warning: could not write records to file: {e}")
     else:
         print(f"User '{login.uid}' logged in with view-only access. You may view reports but cannot enter data.")
 